@@ -0,0 +1,124 @@
+import json
+import math
+import os
+import sqlite3
+import time
+
+
+class RunHistory:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    started_at REAL NOT NULL,
+                    framework TEXT NOT NULL,
+                    step TEXT NOT NULL,
+                    command TEXT NOT NULL,
+                    duration REAL NOT NULL,
+                    exit_status INTEGER NOT NULL,
+                    tool_versions TEXT,
+                    cache_hit INTEGER
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_step ON runs (framework, step)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def record(
+        self,
+        framework,
+        step,
+        command,
+        duration,
+        exit_status,
+        tool_versions=None,
+        cache_hit=None,
+        started_at=None,
+    ):
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT INTO runs (started_at, framework, step, command, duration,
+                                     exit_status, tool_versions, cache_hit)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    started_at if started_at is not None else time.time() - duration,
+                    framework,
+                    step,
+                    command,
+                    duration,
+                    exit_status,
+                    json.dumps(tool_versions) if tool_versions else None,
+                    None if cache_hit is None else int(cache_hit),
+                ),
+            )
+
+    def estimate(self, framework, step, sample_size=20):
+        with self._connect() as conn:
+            rows = conn.execute(
+                """SELECT duration FROM runs
+                   WHERE framework = ? AND step = ? AND exit_status = 0
+                   ORDER BY started_at DESC LIMIT ?""",
+                (framework, step, sample_size),
+            ).fetchall()
+        if not rows:
+            return None, 0
+        return self.percentile([row[0] for row in rows], 50), len(rows)
+
+    def recent(self, limit=15):
+        with self._connect() as conn:
+            return conn.execute(
+                """SELECT started_at, framework, step, duration, exit_status,
+                          tool_versions, cache_hit
+                   FROM runs ORDER BY started_at DESC LIMIT ?""",
+                (limit,),
+            ).fetchall()
+
+    def stats(self):
+        with self._connect() as conn:
+            rows = conn.execute(
+                """SELECT framework, step, duration, exit_status
+                   FROM runs ORDER BY framework, step"""
+            ).fetchall()
+
+        grouped = {}
+        for framework, step, duration, exit_status in rows:
+            entry = grouped.setdefault(
+                (framework, step), {"durations": [], "runs": 0, "ok": 0}
+            )
+            entry["runs"] += 1
+            if exit_status == 0:
+                entry["ok"] += 1
+                entry["durations"].append(duration)
+
+        results = []
+        for (framework, step), entry in grouped.items():
+            durations = entry["durations"]
+            results.append(
+                {
+                    "framework": framework,
+                    "step": step,
+                    "runs": entry["runs"],
+                    "success_rate": entry["ok"] / entry["runs"],
+                    "p50": self.percentile(durations, 50),
+                    "p90": self.percentile(durations, 90),
+                    "p95": self.percentile(durations, 95),
+                    "max": max(durations) if durations else None,
+                }
+            )
+        return results
+
+    @staticmethod
+    def percentile(values, pct):
+        if not values:
+            return None
+        ordered = sorted(values)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
@@ -1,6 +1,11 @@
+import json
 import os
 import shutil
-import urllib.request
+import time
+from datetime import datetime
+from .history import RunHistory
+from .locks import FileLock, ProjectReservation, atomic_download
+from .refresh import ProjectRefresher
 from .utils import Utils
 
 
@@ -8,40 +13,109 @@ class InstallerManager:
     def __init__(self, projects_dir="projects"):
         self.projects_dir = os.path.abspath(projects_dir)
         self.bin_dir = os.path.abspath("bin")
-        if not os.path.exists(self.projects_dir):
-            os.makedirs(self.projects_dir)
-        if not os.path.exists(self.bin_dir):
-            os.makedirs(self.bin_dir)
+        os.makedirs(self.projects_dir, exist_ok=True)
+        os.makedirs(self.bin_dir, exist_ok=True)
+        self.data_dir = os.path.abspath("data")
+        try:
+            self.history = RunHistory(os.path.join(self.data_dir, "history.db"))
+        except Exception as e:
+            Utils.print_colored(f"[!] Run history disabled: {e}", "WARNING")
+            self.history = None
+        Utils.history = self.history
 
     def _ensure_category_dir(self, category):
         category_path = os.path.join(self.projects_dir, category)
-        if not os.path.exists(category_path):
-            os.makedirs(category_path)
+        os.makedirs(category_path, exist_ok=True)
         return category_path
 
+    def _reserve_project(self, target_dir, project_name):
+        separators = [sep for sep in (os.sep, os.altsep, "/") if sep]
+        if project_name in (".", "..") or any(
+            sep in project_name for sep in separators
+        ):
+            Utils.print_colored(
+                f"[!] Invalid project name '{project_name}': must be a single folder name.",
+                "FAIL",
+            )
+            return None
+
+        reservation = ProjectReservation(target_dir, project_name)
+        try:
+            acquired = reservation.acquire()
+        except OSError as e:
+            Utils.print_colored(
+                f"[!] Could not reserve project '{project_name}': {e}", "FAIL"
+            )
+            return None
+        if not acquired:
+            Utils.print_colored(
+                f"[!] '{project_name}' already exists or is being created by another process.",
+                "FAIL",
+            )
+            return None
+        return reservation
+
     def _get_composer_command(self):
         if shutil.which("composer"):
             return ["composer"]
 
         composer_phar = os.path.join(self.bin_dir, "composer.phar")
-        if not os.path.exists(composer_phar):
+        lock = FileLock(os.path.join(self.bin_dir, ".composer.lock"), timeout=300)
+        if not lock.acquire():
             Utils.print_colored(
-                "[*] Global Composer not found. Downloading composer.phar...", "WARNING"
+                "[!] Timed out waiting for another instance to fetch composer.phar.",
+                "FAIL",
             )
-            try:
-                url = "https://getcomposer.org/composer.phar"
-                urllib.request.urlretrieve(url, composer_phar)
-                Utils.print_colored(
-                    "[+] composer.phar downloaded successfully.", "OKGREEN"
+            return None
+
+        try:
+            if os.path.exists(composer_phar):
+                self._record_composer_fetch(
+                    "composer-cache-hit", 0.0, 0, cache_hit=True
                 )
-            except Exception as e:
+            else:
                 Utils.print_colored(
-                    f"[!] Failed to download composer.phar: {e}", "FAIL"
+                    "[*] Global Composer not found. Downloading composer.phar...",
+                    "WARNING",
                 )
-                return None
+                started_at = time.time()
+                try:
+                    url = "https://getcomposer.org/composer.phar"
+                    atomic_download(url, composer_phar)
+                    self._record_composer_fetch(
+                        "fetch-composer", time.time() - started_at, 0, False
+                    )
+                    Utils.print_colored(
+                        "[+] composer.phar downloaded successfully.", "OKGREEN"
+                    )
+                except Exception as e:
+                    self._record_composer_fetch(
+                        "fetch-composer", time.time() - started_at, 1, False
+                    )
+                    Utils.print_colored(
+                        f"[!] Failed to download composer.phar: {e}", "FAIL"
+                    )
+                    return None
+        finally:
+            lock.release()
 
         return ["php", composer_phar]
 
+    def _record_composer_fetch(self, step, duration, exit_status, cache_hit):
+        if self.history is None:
+            return
+        try:
+            self.history.record(
+                "laravel",
+                step,
+                "download composer.phar",
+                duration,
+                exit_status,
+                cache_hit=cache_hit,
+            )
+        except Exception:
+            pass
+
     def install_react_vite(self):
         Utils.print_colored("\n--- Install React (via Vite) ---", "HEADER")
         if not Utils.check_dependency("npm", "Node.js/npm"):
@@ -62,51 +136,58 @@ class InstallerManager:
             "react",
         ]
 
-        if Utils.run_command(cmd, cwd=target_dir):
-            Utils.print_colored(
-                f"\n[+] React project '{project_name}' created successfully!", "OKGREEN"
-            )
+        reservation = self._reserve_project(target_dir, project_name)
+        if not reservation:
+            return
+        with reservation:
+            created = Utils.run_command(cmd, cwd=target_dir, framework="reactjs")
 
-            clean_choice = (
-                input(
-                    "Do you want to clean up the default React boilerplate code? (y/n): "
+            if created:
+                Utils.print_colored(
+                    f"\n[+] React project '{project_name}' created successfully!",
+                    "OKGREEN",
                 )
-                .lower()
-                .strip()
-            )
-            if clean_choice == "y":
-                project_path = os.path.join(target_dir, project_name)
-                self._clean_react_project(project_path)
 
-                router_choice = (
+                clean_choice = (
                     input(
-                        "Do you want to install and setup React Router (react-router-dom)? (y/n): "
+                        "Do you want to clean up the default React boilerplate code? (y/n): "
                     )
                     .lower()
                     .strip()
                 )
-                if router_choice == "y":
-                    self._setup_react_router(project_path)
+                if clean_choice == "y":
+                    project_path = os.path.join(target_dir, project_name)
+                    self._clean_react_project(project_path)
+
+                    router_choice = (
+                        input(
+                            "Do you want to install and setup React Router (react-router-dom)? (y/n): "
+                        )
+                        .lower()
+                        .strip()
+                    )
+                    if router_choice == "y":
+                        self._setup_react_router(project_path)
 
-                tailwind_choice = (
-                    input("Do you want to install and setup Tailwind CSS? (y/n): ")
-                    .lower()
-                    .strip()
-                )
-                if tailwind_choice == "y":
-                    self._setup_tailwind(project_path)
+                    tailwind_choice = (
+                        input("Do you want to install and setup Tailwind CSS? (y/n): ")
+                        .lower()
+                        .strip()
+                    )
+                    if tailwind_choice == "y":
+                        self._setup_tailwind(project_path)
 
-                framer_choice = (
-                    input("Do you want to install and setup Framer Motion? (y/n): ")
-                    .lower()
-                    .strip()
-                )
-                if framer_choice == "y":
-                    self._setup_framer_motion(project_path)
+                    framer_choice = (
+                        input("Do you want to install and setup Framer Motion? (y/n): ")
+                        .lower()
+                        .strip()
+                    )
+                    if framer_choice == "y":
+                        self._setup_framer_motion(project_path)
 
-            self._print_post_install_instructions(
-                "reactjs", project_name, ["npm install", "npm run dev"]
-            )
+                self._print_post_install_instructions(
+                    "reactjs", project_name, ["npm install", "npm run dev"]
+                )
 
     def _clean_react_project(self, project_path):
         try:
@@ -159,7 +240,10 @@ export default App
             )
 
             if not Utils.run_command(
-                ["npm", "install", "react-router-dom"], cwd=project_path
+                ["npm", "install", "react-router-dom"],
+                cwd=project_path,
+                framework="reactjs",
+                step="react-router",
             ):
                 Utils.print_colored("[!] Failed to install react-router-dom", "FAIL")
                 return
@@ -341,7 +425,9 @@ ReactDOM.createRoot(document.getElementById('root')).render(
                 "tailwindcss",
                 "@tailwindcss/vite",
             ]
-            if not Utils.run_command(cmd, cwd=project_path):
+            if not Utils.run_command(
+                cmd, cwd=project_path, framework="reactjs", step="tailwind"
+            ):
                 Utils.print_colored("[!] Failed to install Tailwind CSS", "FAIL")
                 return
 
@@ -404,7 +490,10 @@ export default {
             Utils.print_colored("\n[*] Installing Framer Motion...", "WARNING")
 
             if not Utils.run_command(
-                ["npm", "install", "framer-motion"], cwd=project_path
+                ["npm", "install", "framer-motion"],
+                cwd=project_path,
+                framework="reactjs",
+                step="framer-motion",
             ):
                 Utils.print_colored("[!] Failed to install Framer Motion", "FAIL")
                 return
@@ -472,7 +561,13 @@ export default PageTransition;"""
             "--ignore-platform-req=ext-fileinfo",
         ]
 
-        if Utils.run_command(full_cmd, cwd=target_dir):
+        reservation = self._reserve_project(target_dir, project_name)
+        if not reservation:
+            return
+        with reservation:
+            created = Utils.run_command(full_cmd, cwd=target_dir, framework="laravel")
+
+        if created:
             Utils.print_colored(
                 f"\n[+] Laravel project '{project_name}' created successfully!",
                 "OKGREEN",
@@ -506,7 +601,13 @@ export default PageTransition;"""
             "@/*",
         ]
 
-        if Utils.run_command(cmd, cwd=target_dir):
+        reservation = self._reserve_project(target_dir, project_name)
+        if not reservation:
+            return
+        with reservation:
+            created = Utils.run_command(cmd, cwd=target_dir, framework="nextjs")
+
+        if created:
             Utils.print_colored(
                 f"\n[+] Next.js project '{project_name}' created successfully!",
                 "OKGREEN",
@@ -527,7 +628,13 @@ export default PageTransition;"""
         target_dir = self._ensure_category_dir("vuejs")
         cmd = ["npm", "create", "vite@latest", project_name, "--", "--template", "vue"]
 
-        if Utils.run_command(cmd, cwd=target_dir):
+        reservation = self._reserve_project(target_dir, project_name)
+        if not reservation:
+            return
+        with reservation:
+            created = Utils.run_command(cmd, cwd=target_dir, framework="vuejs")
+
+        if created:
             Utils.print_colored(
                 f"\n[+] Vue project '{project_name}' created successfully!", "OKGREEN"
             )
@@ -555,7 +662,13 @@ export default PageTransition;"""
             "svelte",
         ]
 
-        if Utils.run_command(cmd, cwd=target_dir):
+        reservation = self._reserve_project(target_dir, project_name)
+        if not reservation:
+            return
+        with reservation:
+            created = Utils.run_command(cmd, cwd=target_dir, framework="svelte")
+
+        if created:
             Utils.print_colored(
                 f"\n[+] Svelte project '{project_name}' created successfully!",
                 "OKGREEN",
@@ -585,14 +698,104 @@ export default PageTransition;"""
             "npm",
         ]
 
-        if Utils.run_command(cmd, cwd=target_dir):
+        reservation = self._reserve_project(target_dir, project_name)
+        if not reservation:
+            return
+        with reservation:
+            created = Utils.run_command(cmd, cwd=target_dir, framework="nestjs")
+
+            if created:
+                Utils.print_colored(
+                    f"\n[+] NestJS project '{project_name}' created successfully!",
+                    "OKGREEN",
+                )
+
+                fastify_choice = (
+                    input(
+                        "Do you want to switch the HTTP platform to Fastify (with compression)? (y/n): "
+                    )
+                    .lower()
+                    .strip()
+                )
+                start_commands = ["npm run start:dev"]
+                if fastify_choice == "y":
+                    project_path = os.path.join(target_dir, project_name)
+                    if self._setup_nestjs_fastify(project_path):
+                        start_commands = ["npm run start:dev", "npm run bench"]
+
+                self._print_post_install_instructions(
+                    "nestjs", project_name, start_commands
+                )
+
+    def _setup_nestjs_fastify(self, project_path):
+        try:
             Utils.print_colored(
-                f"\n[+] NestJS project '{project_name}' created successfully!",
-                "OKGREEN",
+                "\n[*] Installing @nestjs/platform-fastify and @fastify/compress...",
+                "WARNING",
             )
-            self._print_post_install_instructions(
-                "nestjs", project_name, ["npm run start:dev"]
+
+            if not Utils.run_command(
+                ["npm", "install", "@nestjs/platform-fastify", "@fastify/compress"],
+                cwd=project_path,
+                framework="nestjs",
+                step="fastify",
+            ):
+                Utils.print_colored("[!] Failed to install Fastify platform", "FAIL")
+                return False
+
+            if not Utils.run_command(
+                ["npm", "install", "-D", "autocannon"],
+                cwd=project_path,
+                framework="nestjs",
+                step="autocannon",
+            ):
+                Utils.print_colored("[!] Failed to install autocannon", "FAIL")
+                return False
+
+            Utils.print_colored(
+                "[*] Rewriting main.ts bootstrap for Fastify...", "WARNING"
+            )
+
+            with open(os.path.join(project_path, "src", "main.ts"), "w") as f:
+                f.write(
+                    """import { NestFactory } from '@nestjs/core';
+import {
+  FastifyAdapter,
+  NestFastifyApplication,
+} from '@nestjs/platform-fastify';
+import compression from '@fastify/compress';
+import { AppModule } from './app.module';
+
+async function bootstrap() {
+  const app = await NestFactory.create<NestFastifyApplication>(
+    AppModule,
+    new FastifyAdapter({ keepAliveTimeout: 65000 }),
+  );
+  await app.register(compression, { encodings: ['gzip', 'deflate'] });
+  app.enableShutdownHooks();
+
+  // Fastify only listens on localhost by default; bind to all interfaces.
+  await app.listen(process.env.PORT ?? 3000, '0.0.0.0');
+}
+bootstrap();
+"""
+                )
+
+            self._write_autocannon_script(project_path, "bench.js", "BENCH")
+
+            self._add_package_scripts(
+                project_path, {"bench": "node ./scripts/bench.js"}
+            )
+
+            Utils.print_colored(
+                "[+] Fastify setup complete! (Run 'npm run bench' against a running app)",
+                "OKGREEN",
             )
+            return True
+
+        except Exception as e:
+            Utils.print_colored(f"[!] Error during Fastify setup: {e}", "FAIL")
+            return False
 
     def install_angular(self):
         Utils.print_colored("\n--- Install Angular ---", "HEADER")
@@ -616,7 +819,13 @@ export default PageTransition;"""
             "--defaults",
         ]
 
-        if Utils.run_command(cmd, cwd=target_dir):
+        reservation = self._reserve_project(target_dir, project_name)
+        if not reservation:
+            return
+        with reservation:
+            created = Utils.run_command(cmd, cwd=target_dir, framework="angular")
+
+        if created:
             Utils.print_colored(
                 f"\n[+] Angular project '{project_name}' created successfully!",
                 "OKGREEN",
@@ -637,14 +846,633 @@ export default PageTransition;"""
         target_dir = self._ensure_category_dir("express")
         cmd = ["npx", "-y", "express-generator@latest", project_name, "--no-view"]
 
-        if Utils.run_command(cmd, cwd=target_dir):
+        reservation = self._reserve_project(target_dir, project_name)
+        if not reservation:
+            return
+        with reservation:
+            created = Utils.run_command(cmd, cwd=target_dir, framework="express")
+
+            if created:
+                Utils.print_colored(
+                    f"\n[+] Express project '{project_name}' created successfully!",
+                    "OKGREEN",
+                )
+
+                start_commands = ["npm install", "npm start"]
+                cluster_choice = (
+                    input(
+                        "Do you want to setup a multi-core cluster launcher with performance tuning? (y/n): "
+                    )
+                    .lower()
+                    .strip()
+                )
+                if cluster_choice == "y":
+                    project_path = os.path.join(target_dir, project_name)
+                    if self._setup_express_cluster(project_path):
+                        start_commands = ["npm run start:cluster", "npm run loadtest"]
+
+                self._print_post_install_instructions(
+                    "express", project_name, start_commands
+                )
+
+    def _setup_express_cluster(self, project_path):
+        try:
+            Utils.print_colored(
+                "\n[*] Installing compression and autocannon...", "WARNING"
+            )
+
+            if not Utils.run_command(
+                ["npm", "install", "compression"],
+                cwd=project_path,
+                framework="express",
+                step="compression",
+            ):
+                Utils.print_colored("[!] Failed to install compression", "FAIL")
+                return False
+
+            if not Utils.run_command(
+                ["npm", "install", "-D", "autocannon"],
+                cwd=project_path,
+                framework="express",
+                step="autocannon",
+            ):
+                Utils.print_colored("[!] Failed to install autocannon", "FAIL")
+                return False
+
+            Utils.print_colored(
+                "[*] Configuring app.js for compression and static caching...",
+                "WARNING",
+            )
+
+            with open(os.path.join(project_path, "app.js"), "w") as f:
+                f.write(
+                    """var express = require('express');
+var path = require('path');
+var compression = require('compression');
+var cookieParser = require('cookie-parser');
+var logger = require('morgan');
+
+var indexRouter = require('./routes/index');
+var usersRouter = require('./routes/users');
+
+var app = express();
+
+app.disable('x-powered-by');
+app.use(compression());
+app.use(logger(process.env.NODE_ENV === 'production' ? 'combined' : 'dev'));
+app.use(express.json());
+app.use(express.urlencoded({ extended: false }));
+app.use(cookieParser());
+app.use(
+  express.static(path.join(__dirname, 'public'), {
+    maxAge: '7d',
+    etag: true,
+    lastModified: true,
+    setHeaders: function (res, filePath) {
+      if (filePath.endsWith('.html')) {
+        res.setHeader('Cache-Control', 'no-cache');
+      }
+    },
+  })
+);
+
+app.use('/', indexRouter);
+app.use('/users', usersRouter);
+
+module.exports = app;
+"""
+                )
+
+            www_path = os.path.join(project_path, "bin", "www")
+            with open(www_path, "r") as f:
+                www = f.read()
+            server_line = "var server = http.createServer(app);"
+            if server_line in www and "keepAliveTimeout" not in www:
+                www = www.replace(
+                    server_line,
+                    server_line
+                    + "\nserver.keepAliveTimeout = 65000;\nserver.headersTimeout = 66000;",
+                )
+                with open(www_path, "w") as f:
+                    f.write(www)
+            else:
+                Utils.print_colored(
+                    "[!] Could not add keep-alive tuning to bin/www (unexpected layout).",
+                    "WARNING",
+                )
+
+            Utils.print_colored(
+                "[*] Creating cluster launcher (bin/cluster)...", "WARNING"
+            )
+
+            with open(os.path.join(project_path, "bin", "cluster"), "w") as f:
+                f.write(
+                    """#!/usr/bin/env node
+
+var cluster = require('cluster');
+var http = require('http');
+var os = require('os');
+
+var port = parseInt(process.env.PORT || '3000', 10);
+var workerCount = parseInt(process.env.WEB_CONCURRENCY || '0', 10) ||
+  (os.availableParallelism ? os.availableParallelism() : os.cpus().length);
+
+if (cluster.isPrimary) {
+  var restarting = false;
+
+  console.log('Primary ' + process.pid + ' starting ' + workerCount + ' workers');
+  for (var i = 0; i < workerCount; i++) {
+    cluster.fork();
+  }
+
+  cluster.on('exit', function (worker, code, signal) {
+    // Replacements that die mid-roll are handled by the rolling restart itself.
+    if (worker.exitedAfterDisconnect || worker.rollingReplacement) {
+      return;
+    }
+    console.log('Worker ' + worker.process.pid + ' died (' + (signal || code) + '), restarting');
+    cluster.fork();
+  });
+
+  // Rolling restart: replace workers one at a time so the port is never left unserved.
+  process.on('SIGHUP', function () {
+    if (restarting) {
+      return;
+    }
+    restarting = true;
+    var workers = Object.values(cluster.workers);
+
+    (function next(index) {
+      if (index >= workers.length) {
+        restarting = false;
+        console.log('Rolling restart complete');
+        return;
+      }
+      var old = workers[index];
+      // Skip workers that crashed mid-roll; the crash handler already replaced them.
+      if (old.isDead() || !cluster.workers[old.id]) {
+        next(index + 1);
+        return;
+      }
+      var replacement = cluster.fork();
+      replacement.rollingReplacement = true;
+
+      var startTimer = setTimeout(function () {
+        replacement.removeListener('exit', onEarlyExit);
+        replacement.kill();
+        abort('did not start listening in time');
+      }, 30000);
+
+      function abort(reason) {
+        clearTimeout(startTimer);
+        restarting = false;
+        console.log('Rolling restart aborted: replacement worker ' + reason);
+      }
+
+      function onEarlyExit() {
+        abort('exited before listening');
+      }
+
+      replacement.once('exit', onEarlyExit);
+      replacement.once('listening', function () {
+        clearTimeout(startTimer);
+        replacement.removeListener('exit', onEarlyExit);
+        replacement.rollingReplacement = false;
+        old.disconnect();
+        var timer = setTimeout(function () { old.kill(); }, 10000);
+        old.once('exit', function () {
+          clearTimeout(timer);
+          next(index + 1);
+        });
+      });
+    })(0);
+  });
+
+  process.on('SIGTERM', function () {
+    for (var id in cluster.workers) {
+      cluster.workers[id].disconnect();
+    }
+  });
+} else {
+  var app = require('../app');
+  app.set('port', port);
+
+  var server = http.createServer(app);
+  server.keepAliveTimeout = 65000;
+  server.headersTimeout = 66000;
+  server.listen(port);
+
+  process.on('SIGTERM', function () {
+    server.close(function () {
+      process.exit(0);
+    });
+  });
+}
+"""
+                )
+
+            self._write_autocannon_script(project_path, "loadtest.js", "LOADTEST")
+
+            self._add_package_scripts(
+                project_path,
+                {
+                    "start:cluster": "node ./bin/cluster",
+                    "loadtest": "node ./scripts/loadtest.js",
+                },
+            )
+
             Utils.print_colored(
-                f"\n[+] Express project '{project_name}' created successfully!",
+                "[+] Cluster launcher setup complete! (Added bin/cluster, scripts/loadtest.js)",
                 "OKGREEN",
             )
-            self._print_post_install_instructions(
-                "express", project_name, ["npm install", "npm start"]
+            return True
+
+        except Exception as e:
+            Utils.print_colored(f"[!] Error during cluster setup: {e}", "FAIL")
+            return False
+
+    def install_workspace(self):
+        Utils.print_colored(
+            "\n--- Create Full-Stack Workspace (monorepo) ---", "HEADER"
+        )
+        if not Utils.check_dependency("npx", "npx"):
+            return
+
+        workspace_name = input("Enter workspace name: ").strip()
+        if not workspace_name:
+            return
+
+        frontends = {
+            "1": ("React.js (Vite)", "reactjs"),
+            "2": ("Vue.js (Vite)", "vuejs"),
+            "3": ("Svelte (Vite)", "svelte"),
+            "4": ("Next.js", "nextjs"),
+            "0": ("None", None),
+        }
+        backends = {
+            "1": ("NestJS", "nestjs"),
+            "2": ("Express.js", "express"),
+            "0": ("None", None),
+        }
+
+        Utils.print_colored("\nSelect a frontend:", "BOLD")
+        for key, value in frontends.items():
+            print(f" [{key}] {value[0]}")
+        frontend = frontends.get(input("Enter choice: ").strip(), (None, None))[1]
+
+        Utils.print_colored("\nSelect a backend:", "BOLD")
+        for key, value in backends.items():
+            print(f" [{key}] {value[0]}")
+        backend = backends.get(input("Enter choice: ").strip(), (None, None))[1]
+
+        apps = [(name, fw) for name, fw in (("web", frontend), ("api", backend)) if fw]
+        if not apps:
+            Utils.print_colored("[!] No apps selected.", "FAIL")
+            return
+
+        package_manager = "npm"
+        if shutil.which("pnpm"):
+            pnpm_choice = (
+                input("Use pnpm workspaces instead of npm workspaces? (y/n): ")
+                .lower()
+                .strip()
             )
+            if pnpm_choice == "y":
+                package_manager = "pnpm"
+
+        workspace_path = os.path.join(
+            self._ensure_category_dir("workspaces"), workspace_name
+        )
+        reservation = self._reserve_project(
+            os.path.dirname(workspace_path), workspace_name
+        )
+        if not reservation:
+            return
+        with reservation:
+            try:
+                created = self._build_workspace(
+                    workspace_path, workspace_name, apps, package_manager
+                )
+            except Exception as e:
+                Utils.print_colored(f"[!] Error during workspace setup: {e}", "FAIL")
+                created = False
+            if not created:
+                shutil.rmtree(workspace_path, ignore_errors=True)
+                Utils.print_colored(
+                    f"[*] Removed incomplete workspace '{workspace_name}'.", "WARNING"
+                )
+                return
+
+        Utils.print_colored(
+            f"\n[+] Workspace '{workspace_name}' created successfully!", "OKGREEN"
+        )
+        self._print_post_install_instructions(
+            "workspaces",
+            workspace_name,
+            [f"{package_manager} run dev:{app_name}" for app_name, _ in apps],
+        )
+
+    def _build_workspace(self, workspace_path, workspace_name, apps, package_manager):
+        apps_dir = os.path.join(workspace_path, "apps")
+        os.makedirs(apps_dir)
+        self._write_workspace_root(
+            workspace_path, workspace_name, apps, package_manager
+        )
+
+        for app_name, framework in apps:
+            cmd = self._get_workspace_app_command(framework, app_name, package_manager)
+            if not Utils.run_command(
+                cmd, cwd=apps_dir, framework="workspace", step=f"scaffold-{framework}"
+            ):
+                Utils.print_colored(
+                    f"[!] Failed to scaffold '{app_name}' ({framework}).", "FAIL"
+                )
+                return False
+
+        Utils.print_colored(
+            "\n[*] Installing all workspace dependencies once (hoisted)...", "WARNING"
+        )
+        if not Utils.run_command(
+            [package_manager, "install"],
+            cwd=workspace_path,
+            framework="workspace",
+            step="install",
+        ):
+            Utils.print_colored("[!] Failed to install workspace dependencies", "FAIL")
+            return False
+
+        return True
+
+    def _get_workspace_app_command(self, framework, app_name, package_manager):
+        vite_templates = {"reactjs": "react", "vuejs": "vue", "svelte": "svelte"}
+        if framework in vite_templates:
+            return [
+                "npm",
+                "create",
+                "vite@latest",
+                app_name,
+                "--",
+                "--template",
+                vite_templates[framework],
+            ]
+        if framework == "nextjs":
+            return [
+                "npx",
+                "create-next-app@latest",
+                app_name,
+                f"--use-{package_manager}",
+                "--yes",
+                "--typescript",
+                "--tailwind",
+                "--eslint",
+                "--app",
+                "--src-dir",
+                "--import-alias",
+                "@/*",
+                "--skip-install",
+                "--disable-git",
+            ]
+        if framework == "nestjs":
+            return [
+                "npx",
+                "-y",
+                "@nestjs/cli@latest",
+                "new",
+                app_name,
+                "--package-manager",
+                package_manager,
+                "--skip-install",
+                "--skip-git",
+            ]
+        return ["npx", "-y", "express-generator@latest", app_name, "--no-view"]
+
+    def _write_workspace_root(
+        self, workspace_path, workspace_name, apps, package_manager
+    ):
+        dev_scripts = {
+            "reactjs": "dev",
+            "vuejs": "dev",
+            "svelte": "dev",
+            "nextjs": "dev",
+            "nestjs": "start:dev",
+            "express": "start",
+        }
+
+        scripts = {}
+        for app_name, framework in apps:
+            if package_manager == "pnpm":
+                scripts[f"dev:{app_name}"] = (
+                    f"pnpm --filter ./apps/{app_name} run {dev_scripts[framework]}"
+                )
+            else:
+                scripts[f"dev:{app_name}"] = (
+                    f"npm run {dev_scripts[framework]} -w apps/{app_name}"
+                )
+        if package_manager == "pnpm":
+            scripts["build"] = "pnpm -r --if-present run build"
+        else:
+            scripts["build"] = "npm run build --workspaces --if-present"
+
+        package_json = {"name": workspace_name, "private": True, "scripts": scripts}
+        if package_manager == "npm":
+            package_json["workspaces"] = ["apps/*"]
+
+        with open(os.path.join(workspace_path, "package.json"), "w") as f:
+            json.dump(package_json, f, indent=2)
+            f.write("\n")
+
+        if package_manager == "pnpm":
+            with open(os.path.join(workspace_path, "pnpm-workspace.yaml"), "w") as f:
+                f.write("packages:\n  - 'apps/*'\n")
+
+        with open(os.path.join(workspace_path, ".gitignore"), "w") as f:
+            f.write("node_modules/\ndist/\n.next/\n.env\n")
+
+    def refresh_projects(self):
+        Utils.print_colored("\n--- Refresh Project Dependencies ---", "HEADER")
+
+        categories = input(
+            "Categories to refresh (comma separated, blank for all): "
+        ).strip()
+        categories = [c.strip() for c in categories.split(",") if c.strip()]
+
+        refresher = ProjectRefresher(self.projects_dir, history=self.history)
+        projects = refresher.discover(categories)
+        if not projects:
+            Utils.print_colored("[*] No projects found to refresh.", "WARNING")
+            return
+
+        managers = {project["manager"] for project in projects}
+        if "npm" in managers and not Utils.check_dependency("npm", "Node.js/npm"):
+            return
+        if "pnpm" in managers and not Utils.check_dependency("pnpm", "pnpm"):
+            return
+        if "composer" in managers and Utils.check_dependency("php", "PHP"):
+            refresher.composer_cmd = self._get_composer_command()
+
+        default_jobs = min(4, os.cpu_count() or 1)
+        jobs = input(f"Max parallel jobs [{default_jobs}]: ").strip()
+        max_workers = int(jobs) if jobs.isdigit() and int(jobs) > 0 else default_jobs
+
+        apply_choice = (
+            input("Apply updates? (n = only check for outdated packages) (y/n): ")
+            .lower()
+            .strip()
+        )
+        apply = apply_choice == "y"
+
+        Utils.print_colored(
+            f"\n[*] Refreshing {len(projects)} project(s) with up to {max_workers} parallel jobs...",
+            "WARNING",
+        )
+
+        def on_done(result):
+            label = f"{result['category']}/{result['name']}"
+            duration = Utils.format_duration(result["duration"])
+            if result["status"] == "ok":
+                Utils.print_colored(f"[+] {label} done in {duration}", "OKGREEN")
+            elif result["status"] == "skipped":
+                Utils.print_colored(
+                    f"[*] {label} skipped: {result['error']}", "WARNING"
+                )
+            else:
+                Utils.print_colored(f"[!] {label} failed: {result['error']}", "FAIL")
+
+        started_at = time.time()
+        results = refresher.run(
+            projects, max_workers=max_workers, apply=apply, on_done=on_done
+        )
+        self._print_refresh_report(results, apply, time.time() - started_at)
+
+    def _print_refresh_report(self, results, apply, total_duration):
+        Utils.print_colored("\nRefresh report:", "BOLD")
+        print(
+            f"  {'Project':<32} {'Manager':<9} {'Outdated':>8} "
+            f"{'Updated':>8} {'Time':>8}  Status"
+        )
+        for result in results:
+            label = f"{result['category']}/{result['name']}"
+            print(
+                f"  {label:<32} {result['manager']:<9} {len(result['outdated']):>8} "
+                f"{len(result['updated']):>8} "
+                f"{Utils.format_duration(result['duration']):>8}  {result['status']}"
+            )
+
+        for result in results:
+            changes = (
+                result["updated"]
+                if apply
+                else [
+                    ProjectRefresher.describe_change(
+                        item["package"], item["current"], item["latest"]
+                    )
+                    for item in result["outdated"]
+                ]
+            )
+            if not changes:
+                continue
+            Utils.print_colored(
+                f"\n{result['category']}/{result['name']} "
+                f"({'updated' if apply else 'outdated'}):",
+                "OKCYAN",
+            )
+            for change in changes:
+                print(f"  {change}")
+
+        failed = sum(1 for result in results if result["status"] == "failed")
+        Utils.print_colored(
+            f"\n[+] Refreshed {len(results) - failed}/{len(results)} project(s) "
+            f"in {Utils.format_duration(total_duration)}.",
+            "OKGREEN" if not failed else "WARNING",
+        )
+
+    def show_history(self):
+        Utils.print_colored("\n--- Run History & Stats ---", "HEADER")
+        if self.history is None:
+            Utils.print_colored("[!] Run history is not available.", "FAIL")
+            return
+
+        stats = self.history.stats()
+        if not stats:
+            Utils.print_colored("[*] No runs recorded yet.", "WARNING")
+            return
+
+        def fmt(seconds):
+            return "-" if seconds is None else Utils.format_duration(seconds)
+
+        Utils.print_colored("\nDuration percentiles per framework and step:", "BOLD")
+        print(
+            f"  {'Framework':<10} {'Step':<16} {'Runs':>5} {'OK %':>6} "
+            f"{'p50':>8} {'p90':>8} {'p95':>8} {'Max':>8}"
+        )
+        for row in stats:
+            print(
+                f"  {row['framework']:<10} {row['step']:<16} {row['runs']:>5} "
+                f"{row['success_rate'] * 100:>5.0f}% {fmt(row['p50']):>8} "
+                f"{fmt(row['p90']):>8} {fmt(row['p95']):>8} {fmt(row['max']):>8}"
+            )
+
+        Utils.print_colored("\nMost recent runs:", "BOLD")
+        for (
+            started_at,
+            framework,
+            step,
+            duration,
+            exit_status,
+            tool_versions,
+            cache_hit,
+        ) in self.history.recent():
+            when = datetime.fromtimestamp(started_at).strftime("%Y-%m-%d %H:%M")
+            status = "ok" if exit_status == 0 else f"exit {exit_status}"
+            cache = {None: "", 1: " [cache hit]", 0: " [cache miss]"}[cache_hit]
+            versions = ", ".join(
+                f"{tool} {version}"
+                for tool, version in json.loads(tool_versions or "{}").items()
+            )
+            print(
+                f"  {when}  {framework}/{step:<16} {fmt(duration):>8}  {status}{cache}"
+                + (f"  ({versions})" if versions else "")
+            )
+
+    def _write_autocannon_script(self, project_path, filename, env_prefix):
+        os.makedirs(os.path.join(project_path, "scripts"), exist_ok=True)
+
+        with open(os.path.join(project_path, "scripts", filename), "w") as f:
+            f.write(
+                f"""const autocannon = require('autocannon');
+
+const url = process.env.{env_prefix}_URL || 'http://localhost:3000';
+
+const instance = autocannon(
+  {{
+    url,
+    connections: parseInt(process.env.{env_prefix}_CONNECTIONS || '100', 10),
+    duration: parseInt(process.env.{env_prefix}_DURATION || '10', 10),
+  }},
+  (err, result) => {{
+    if (err) {{
+      console.error(err);
+      process.exit(1);
+    }}
+    console.log(`Requests/sec (avg): ${{result.requests.average}}`);
+    console.log(`Latency p99 (ms):   ${{result.latency.p99}}`);
+  }}
+);
+
+autocannon.track(instance, {{ renderProgressBar: true }});
+"""
+            )
+
+    def _add_package_scripts(self, project_path, scripts):
+        package_json_path = os.path.join(project_path, "package.json")
+        with open(package_json_path, "r") as f:
+            package_json = json.load(f)
+
+        package_json.setdefault("scripts", {}).update(scripts)
+
+        with open(package_json_path, "w") as f:
+            json.dump(package_json, f, indent=2)
+            f.write("\n")
 
     def _print_post_install_instructions(self, category, project_name, commands):
         Utils.print_colored("\nTo get started, run:", "BOLD")
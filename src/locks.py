@@ -0,0 +1,110 @@
+import os
+import tempfile
+import time
+import urllib.request
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    def __init__(self, path, timeout=None, poll_interval=0.1):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    def _try_lock(self, fd):
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self, blocking=True):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.time() + self.timeout
+        while not self._try_lock(fd):
+            if not blocking or (deadline is not None and time.time() >= deadline):
+                os.close(fd)
+                return False
+            time.sleep(self.poll_interval)
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if os.name == "nt":
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        if not self.acquire():
+            raise TimeoutError(f"Timed out waiting for lock: {self.path}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def project_lock(parent_dir, name):
+    # Lock files are never unlinked: removing one while another process has it
+    # open would let a third process lock a fresh file at the same path.
+    return FileLock(os.path.join(parent_dir, f".{name}.lock"))
+
+
+class ProjectReservation:
+    def __init__(self, parent_dir, name):
+        self.path = os.path.join(parent_dir, name)
+        self._lock = project_lock(parent_dir, name)
+
+    def acquire(self):
+        if not self._lock.acquire(blocking=False):
+            return False
+        if os.path.exists(self.path):
+            self.release()
+            return False
+        return True
+
+    def release(self):
+        self._lock.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def atomic_download(url, destination):
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(destination), prefix=".", suffix=".part"
+    )
+    try:
+        with os.fdopen(fd, "wb") as tmp_file, urllib.request.urlopen(url) as response:
+            while True:
+                chunk = response.read(64 * 1024)
+                if not chunk:
+                    break
+                tmp_file.write(chunk)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, destination)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -15,6 +15,15 @@ class Menu:
             "6": ("Install NestJS", self.installer.install_nestjs),
             "7": ("Install Angular", self.installer.install_angular),
             "8": ("Install Express.js", self.installer.install_express),
+            "9": ("Show Run History & Stats", self.installer.show_history),
+            "10": (
+                "Create Full-Stack Workspace (monorepo)",
+                self.installer.install_workspace,
+            ),
+            "11": (
+                "Refresh Dependencies of Existing Projects",
+                self.installer.refresh_projects,
+            ),
             "0": ("Exit", self.exit_tool),
         }
 
@@ -0,0 +1,264 @@
+import json
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .locks import project_lock
+
+
+class ProjectRefresher:
+    def __init__(self, projects_dir, composer_cmd=None, history=None):
+        self.projects_dir = projects_dir
+        self.composer_cmd = composer_cmd
+        self.history = history
+
+    def discover(self, categories=None):
+        projects = []
+        if not os.path.isdir(self.projects_dir):
+            return projects
+
+        for category in sorted(os.listdir(self.projects_dir)):
+            category_path = os.path.join(self.projects_dir, category)
+            if category.startswith(".") or not os.path.isdir(category_path):
+                continue
+            if categories and category not in categories:
+                continue
+
+            for name in sorted(os.listdir(category_path)):
+                project_path = os.path.join(category_path, name)
+                if name.startswith(".") or not os.path.isdir(project_path):
+                    continue
+                manager = self._detect_manager(project_path)
+                if manager:
+                    projects.append(
+                        {
+                            "category": category,
+                            "name": name,
+                            "path": project_path,
+                            "manager": manager,
+                            "workspace": self._is_workspace_root(project_path),
+                        }
+                    )
+        return projects
+
+    def _detect_manager(self, project_path):
+        if os.path.exists(os.path.join(project_path, "composer.json")):
+            return "composer"
+        if os.path.exists(
+            os.path.join(project_path, "pnpm-lock.yaml")
+        ) or os.path.exists(os.path.join(project_path, "pnpm-workspace.yaml")):
+            return "pnpm"
+        if os.path.exists(os.path.join(project_path, "package.json")):
+            return "npm"
+        return None
+
+    def _is_workspace_root(self, project_path):
+        if os.path.exists(os.path.join(project_path, "pnpm-workspace.yaml")):
+            return True
+        try:
+            with open(os.path.join(project_path, "package.json"), "r") as f:
+                return bool(json.load(f).get("workspaces"))
+        except (OSError, ValueError, AttributeError):
+            return False
+
+    def run(self, projects, max_workers=4, apply=True, on_done=None):
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.refresh_project, project, apply)
+                for project in projects
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if on_done:
+                    on_done(result)
+        return sorted(results, key=lambda r: (r["category"], r["name"]))
+
+    def refresh_project(self, project, apply=True):
+        result = dict(project, outdated=[], updated=[], status="ok", error=None)
+        started_at = time.time()
+
+        lock = project_lock(os.path.dirname(project["path"]), project["name"])
+        if not lock.acquire(blocking=False):
+            result["status"] = "skipped"
+            result["error"] = "busy in another process"
+            result["duration"] = 0.0
+            return result
+
+        try:
+            if project["manager"] == "composer":
+                self._refresh_composer(result, apply)
+            else:
+                self._refresh_node(result, apply)
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+        finally:
+            lock.release()
+
+        result["duration"] = time.time() - started_at
+        return result
+
+    def _refresh_node(self, result, apply):
+        manager = result["manager"]
+        if manager == "pnpm":
+            outdated_cmd = ["pnpm", "outdated", "--format", "json"]
+            update_cmd = ["pnpm", "update"]
+            if result.get("workspace"):
+                outdated_cmd.insert(1, "-r")
+                update_cmd.insert(1, "-r")
+        else:
+            outdated_cmd = ["npm", "outdated", "--json"]
+            update_cmd = ["npm", "update", "--prefer-offline"]
+            if result.get("workspace"):
+                workspace_flags = ["--workspaces", "--include-workspace-root"]
+                outdated_cmd += workspace_flags
+                update_cmd += workspace_flags
+
+        result["outdated"] = self._node_outdated(result, outdated_cmd)
+        if not apply or not result["outdated"]:
+            return
+
+        self._run_step(result, "refresh-update", update_cmd)
+
+        # Confirm what actually changed instead of trusting the pre-update "wanted".
+        remaining = {
+            item["package"]: item["current"]
+            for item in self._node_outdated(result, outdated_cmd)
+        }
+        result["updated"] = []
+        for item in result["outdated"]:
+            after = remaining.get(item["package"], item["wanted"])
+            if after and after != item["current"]:
+                result["updated"].append(
+                    self.describe_change(item["package"], item["current"], after)
+                )
+
+    def _node_outdated(self, result, outdated_cmd):
+        # Both package managers exit with 1 when something is outdated.
+        output = self._run_step(result, "refresh-outdated", outdated_cmd, (0, 1))
+        outdated = json.loads(output or "{}")
+        error = outdated.get("error")
+        if isinstance(error, dict) and ("code" in error or "summary" in error):
+            raise RuntimeError(
+                f"'{' '.join(outdated_cmd)}' failed: "
+                f"{error.get('summary') or error.get('code')}"
+            )
+
+        items = []
+        for package, info in sorted(outdated.items()):
+            # Packages used by several workspaces are reported once per dependent.
+            for entry in info if isinstance(info, list) else [info]:
+                if not isinstance(entry, dict):
+                    continue
+                dependent = entry.get("dependent")
+                items.append(
+                    {
+                        "package": (
+                            f"{package} ({dependent})"
+                            if result.get("workspace") and dependent
+                            else package
+                        ),
+                        "current": entry.get("current"),
+                        "wanted": entry.get("wanted"),
+                        "latest": entry.get("latest"),
+                    }
+                )
+        return items
+
+    @staticmethod
+    def describe_change(package, before, after):
+        return f"{package} {before or 'not installed'} -> {after}"
+
+    def _refresh_composer(self, result, apply):
+        if not self.composer_cmd:
+            raise RuntimeError("Composer is not available")
+
+        output = self._run_step(
+            result,
+            "refresh-outdated",
+            self.composer_cmd + ["outdated", "--direct", "--format=json"],
+        )
+        outdated = json.loads(output or "{}").get("installed", [])
+        result["outdated"] = [
+            {
+                "package": item.get("name"),
+                "current": item.get("version"),
+                "wanted": item.get("latest"),
+                "latest": item.get("latest"),
+            }
+            for item in outdated
+        ]
+
+        if not apply or not result["outdated"]:
+            return
+
+        self._run_step(
+            result,
+            "refresh-update",
+            self.composer_cmd + ["update", "--no-interaction", "--no-progress"],
+        )
+
+        output = self._run_step(
+            result,
+            "refresh-outdated",
+            self.composer_cmd + ["outdated", "--direct", "--format=json"],
+        )
+        remaining = {
+            item.get("name"): item.get("version")
+            for item in json.loads(output or "{}").get("installed", [])
+        }
+        result["updated"] = [
+            self.describe_change(
+                item["package"],
+                item["current"],
+                remaining.get(item["package"], item["latest"]),
+            )
+            for item in result["outdated"]
+            if remaining.get(item["package"], item["latest"]) != item["current"]
+        ]
+
+    def _run_step(self, result, step, command, ok_codes=(0,)):
+        executable = shutil.which(command[0]) or command[0]
+        started_at = time.time()
+        completed = subprocess.run(
+            [executable] + command[1:],
+            cwd=result["path"],
+            capture_output=True,
+            text=True,
+        )
+        succeeded = completed.returncode in ok_codes
+        self._record(
+            result,
+            step,
+            command,
+            time.time() - started_at,
+            0 if succeeded else completed.returncode,
+        )
+
+        if not succeeded:
+            message = (completed.stderr or completed.stdout).strip().splitlines()
+            raise RuntimeError(
+                f"'{' '.join(command)}' exited with {completed.returncode}"
+                + (f": {message[-1]}" if message else "")
+            )
+        return completed.stdout
+
+    def _record(self, result, step, command, duration, exit_status):
+        if self.history is None:
+            return
+        try:
+            # Workspace roots share the label install_workspace records under.
+            framework = "workspace" if result.get("workspace") else result["category"]
+            self.history.record(
+                framework,
+                step,
+                " ".join(command),
+                duration,
+                exit_status,
+                started_at=time.time() - duration,
+            )
+        except Exception:
+            pass
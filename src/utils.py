@@ -2,6 +2,7 @@ import shutil
 import subprocess
 import os
 import sys
+import time
 
 
 class Utils:
@@ -17,6 +18,21 @@ class Utils:
         "UNDERLINE": "\033[4m",
     }
 
+    history = None
+    _tool_versions = {}
+    TOOL_VERSION_COMMANDS = {
+        "node": ["node", "--version"],
+        "npm": ["npm", "--version"],
+        "php": ["php", "-r", "echo PHP_VERSION;"],
+        "composer": ["composer", "--version"],
+    }
+    COMMAND_TOOLS = {
+        "npm": ["node", "npm"],
+        "npx": ["node", "npm"],
+        "php": ["php"],
+        "composer": ["php", "composer"],
+    }
+
     @staticmethod
     def print_colored(text, color="ENDC"):
         if os.name == "nt":
@@ -33,18 +49,95 @@ class Utils:
         return True
 
     @staticmethod
-    def run_command(command, cwd=None):
+    def get_tool_version(tool):
+        if tool not in Utils._tool_versions:
+            version = None
+            executable = shutil.which(tool)
+            if executable:
+                try:
+                    # Run the argv directly so arguments such as the PHP snippet
+                    # are not re-split by the shell.
+                    result = subprocess.run(
+                        [executable] + Utils.TOOL_VERSION_COMMANDS[tool][1:],
+                        capture_output=True,
+                        text=True,
+                        timeout=30,
+                    )
+                    version = result.stdout.strip().splitlines()[0] or None
+                except Exception:
+                    version = None
+            Utils._tool_versions[tool] = version
+        return Utils._tool_versions[tool]
+
+    @staticmethod
+    def format_duration(seconds):
+        if seconds < 60:
+            return f"{seconds:.1f}s"
+        minutes, seconds = divmod(int(round(seconds)), 60)
+        return f"{minutes}m {seconds:02d}s"
+
+    @staticmethod
+    def run_command(command, cwd=None, framework=None, step=None):
+        track = Utils.history is not None and framework is not None
+        step = step or "scaffold"
+        exit_status = None
+        Utils.print_colored(f"[*] Running: {' '.join(command)}", "OKCYAN")
+
+        if track:
+            try:
+                eta, samples = Utils.history.estimate(framework, step)
+                if eta is not None:
+                    Utils.print_colored(
+                        f"[~] Estimated time: ~{Utils.format_duration(eta)} "
+                        f"(median of {samples} previous run{'s' if samples != 1 else ''})",
+                        "OKBLUE",
+                    )
+            except Exception:
+                track = False
+
+        started_at = time.time()
         try:
-            Utils.print_colored(f"[*] Running: {' '.join(command)}", "OKCYAN")
             subprocess.run(command, check=True, cwd=cwd, shell=True)
+            exit_status = 0
             Utils.print_colored("[+] Command executed successfully.", "OKGREEN")
             return True
         except subprocess.CalledProcessError as e:
+            exit_status = e.returncode
             Utils.print_colored(f"[!] Error executing command: {e}", "FAIL")
             return False
         except Exception as e:
+            exit_status = -1
             Utils.print_colored(f"[!] Unexpected error: {e}", "FAIL")
             return False
+        finally:
+            duration = time.time() - started_at
+            # Interrupted runs (e.g. Ctrl-C) leave exit_status unset and are not
+            # recorded, so truncated durations never reach the ETA or percentiles.
+            if track and exit_status is not None:
+                Utils._record_run(
+                    framework, step, command, duration, exit_status, started_at
+                )
+
+    @staticmethod
+    def _record_run(framework, step, command, duration, exit_status, started_at):
+        try:
+            tools = Utils.COMMAND_TOOLS.get(command[0], [])
+            versions = {tool: Utils.get_tool_version(tool) for tool in tools}
+            Utils.history.record(
+                framework,
+                step,
+                " ".join(command),
+                duration,
+                exit_status,
+                tool_versions={k: v for k, v in versions.items() if v},
+                started_at=started_at,
+            )
+            Utils.print_colored(
+                f"[~] Step '{framework}/{step}' took {Utils.format_duration(duration)}.",
+                "OKBLUE",
+            )
+        except Exception as e:
+            Utils.print_colored(f"[!] Could not record run history: {e}", "WARNING")
 
     @staticmethod
     def clear_screen():